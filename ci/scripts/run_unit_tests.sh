@@ -49,7 +49,7 @@ install_dependencies() {
 run_test_dir() {
     local test_dir=$1
     echo "Running tests in $test_dir"
-    pytest $test_dir -v --cov=$test_dir/.. --cov-report=xml
+    OCTOPUS_STRICT=1 pytest $test_dir -v --cov=$test_dir/.. --cov-report=xml
 }
 
 # Main function
@@ -2,7 +2,19 @@
 Octopus - A flexible CICD infrastructure toolkit for test orchestration and container management
 """
 
-from . import core, dsl, orchestration
+import importlib
 
 __version__ = "0.1.0"
 __all__ = ["core", "dsl", "orchestration", "integrations"]
+
+# Subpackages are imported on first attribute access (PEP 562)
+_LAZY_SUBMODULES = {"core", "dsl", "orchestration"}
+
+
+def __getattr__(name: str):
+    """Import a subpackage on first access."""
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f".{name}", __name__)
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
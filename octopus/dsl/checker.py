@@ -3,9 +3,10 @@ from typing import Any
 from pydantic import BaseModel, ConfigDict, Field
 
 from octopus.dsl.constants import TEST_EXPECT_FIELDS, TestMode
+from octopus.dsl.interface import FieldReprMixin
 
 
-class Expect(BaseModel):
+class Expect(FieldReprMixin, BaseModel):
     """Test expectations configuration."""
 
     model_config = ConfigDict(extra="forbid", validate_assignment=True)
@@ -38,12 +39,3 @@ class Expect(BaseModel):
     def to_dict(self) -> dict[str, str]:
         """Convert the expect instance to a dictionary."""
         return {k: v for k, v in self.model_dump().items() if v is not None}
-
-    def __repr__(self) -> str:
-        """Return the string representation of the expect instance."""
-        attrs = []
-        for field in self.model_fields:
-            value = getattr(self, field)
-            if value is not None:
-                attrs.append(f"{field}={value!r}")
-        return f"Expect({', '.join(attrs)})"
@@ -3,6 +3,7 @@ Constants used in the DSL configuration.
 """
 
 import inspect
+import os
 from enum import Enum
 
 
@@ -95,21 +96,24 @@ class Keywords:
     @classmethod
     def is_valid_keyword(cls, key: str) -> bool:
         """Check if the keyword is valid."""
+        return key in _KEYWORDS
 
-        def _get_kw_collection(cls):
-            return [
-                v
-                for k, v in cls.__dict__.items()
-                if not (
-                    k.startswith("_")
-                    or inspect.ismethod(v)
-                    or inspect.isfunction(v)
-                    or isinstance(v, classmethod)
-                    or k in ["model_config", "model_fields"]
-                )
-            ]
 
-        return key in _get_kw_collection(cls)
+# Names in Keywords that are not keywords
+_NON_KEYWORD_NAMES = frozenset({"model_config", "model_fields"})
+
+# All keyword values, collected once from the Keywords class attributes
+_KEYWORDS = frozenset(
+    v
+    for k, v in Keywords.__dict__.items()
+    if not (
+        k.startswith("_")
+        or inspect.ismethod(v)
+        or inspect.isfunction(v)
+        or isinstance(v, classmethod)
+        or k in _NON_KEYWORD_NAMES
+    )
+)
 
 
 # Required fields for each test mode
@@ -132,3 +136,7 @@ TEST_EXPECT_FIELDS = {
 }
 
 SUPPORTED_VERSION = ["0.1.0"]
+
+# Validate field assignment on DSL models, off by default to keep assignment cheap.
+# Set OCTOPUS_STRICT=1 (e.g. in unit tests) to turn it on.
+STRICT_MODE = os.environ.get("OCTOPUS_STRICT", "0") == "1"
@@ -15,10 +15,14 @@ from octopus.dsl.constants import SUPPORTED_VERSION, Keywords
 from octopus.dsl.dag_manager import DAGManager
 from octopus.dsl.dsl_service import DslService
 from octopus.dsl.dsl_test import DslTest
+from octopus.dsl.interface import FieldReprMixin
 from octopus.dsl.variable import Variable
 
+# Prefer the libyaml based loader, fall back to the pure Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-class DslConfig(BaseModel):
+
+class DslConfig(FieldReprMixin, BaseModel):
     """Top-level dsl configuration structure.
 
     This model represents the root structure of the DSL configuration YAML file.
@@ -234,7 +238,7 @@ class DslConfig(BaseModel):
 
         with open(yaml_path) as f:
             try:
-                yaml_data = yaml.load(f, Loader=yaml.FullLoader)
+                yaml_data = yaml.load(f, Loader=_YAML_LOADER)
             except yaml.YAMLError:
                 logger.exception("Failed to load YAML file")
                 return None
@@ -440,15 +444,6 @@ class DslConfig(BaseModel):
             raise ValueError("Current config failed DAG check")
         self._dag_manger.visualize_with_plt()
 
-    def __repr__(self) -> str:
-        """Custom string representation."""
-        attrs = []
-        for field in self.model_fields:
-            value = getattr(self, field)
-            if value is not None:
-                attrs.append(f"{field}={value!r}")
-        return f"DslConfig({', '.join(attrs)})"
-
 
 if __name__ == "__main__":
     test_yaml_file = Path(__file__).parent / "test_data" / "config_sample_v0.1.0.yaml"
@@ -2,21 +2,22 @@
 Service configuration models.
 """
 
-import copy
 from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
+from octopus.dsl.constants import STRICT_MODE
+from octopus.dsl.interface import FieldReprMixin
 from octopus.dsl.variable import VariableEvaluator
 
 
-class DslService(BaseModel):
+class DslService(FieldReprMixin, BaseModel):
     """Service configuration.
 
     This model represents the configuration of a service.
     """
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", validate_assignment=STRICT_MODE)
 
     name: str = Field(description="Service name")
     desc: str = Field(description="Service description")
@@ -32,7 +33,10 @@ class DslService(BaseModel):
     )
     trigger: list[str] | None = Field(default_factory=list, description="the tests that current one triggers")
 
-    __origin_data: dict[str, Any] = PrivateAttr(default_factory=dict)
+    # original data of the fields that contain variable references
+    __templates: dict[str, Any] = PrivateAttr(default_factory=dict)
+    # (variables key, evaluated data of templated fields) of the last evaluation
+    __evaluated_cache: tuple[Any, dict[str, Any]] | None = PrivateAttr(default=None)
 
     def __init__(self, **data):
         """Initialize service configuration.
@@ -41,8 +45,8 @@ class DslService(BaseModel):
             **data: Service configuration data
         """
         super().__init__(**data)
-        # Store original data for evaluate
-        self.__origin_data = copy.deepcopy(data)
+        # Store templated fields for evaluate
+        self.__templates = VariableEvaluator.extract_templates(data)
 
     @classmethod
     def from_dict(cls, body: dict[str, Any]) -> "DslService":
@@ -56,26 +60,37 @@ class DslService(BaseModel):
     def evaluate(self, variables: dict[str, Any]) -> None:
         """Evaluate the service with given variables.
 
-        This method is idempotent, multiple evaluateions produce the same result.
-        1. Restoring the original data from __origin_data
+        This method is idempotent, multiple evaluations produce the same result.
+        1. Restoring the original data of templated fields from __templates
         2. Evaluating variables in the restored data
-        3. Updating the model with evaluated values
+        3. Updating the templated fields with evaluated values
+
+        Nothing is done when no field contains variable references. The values
+        of the last evaluation are cached and restored from a copy when called
+        again with the same variables.
 
         Args:
             variables: A dictionary of variables to evaluate the service with
         """
-        # Restore original data
-        data = copy.deepcopy(self.__origin_data)
-
-        # Evaluate variables in the data
-        VariableEvaluator.evaluate_dict(data, variables)
-
-        # Update model with evaluated values
-        updated_data = self.model_validate(data)
-        for k, v in updated_data.__dict__.items():
-            if k.startswith("_") or k in ["model_config", "model_fields"]:
-                continue
-            setattr(self, k, v)
+        if not self.__templates:
+            return
+
+        key = VariableEvaluator.cache_key(variables)
+        if self.__evaluated_cache is not None and self.__evaluated_cache[0] == key:
+            # Copy the cached data, fields may have been changed in place since
+            data = VariableEvaluator.snapshot(self.__evaluated_cache[1])
+        else:
+            # Restore original data of templated fields
+            data = VariableEvaluator.snapshot(self.__templates)
+
+            # Evaluate variables in the data
+            VariableEvaluator.evaluate_dict(data, variables)
+            self.__evaluated_cache = (key, VariableEvaluator.snapshot(data))
+
+        # Update model with evaluated values. The original data was validated on
+        # construction and evaluation only substitutes string leaves, so it is
+        # trusted: write the fields in place without validation.
+        self.__dict__.update(data)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert the service instance to a dictionary."""
@@ -97,24 +112,15 @@ class DslService(BaseModel):
         """Get the command of the service."""
         cmd = ["docker run"]
         if self.name:
-            cmd.extend([f" --name {self.name}"])
+            cmd.append(f" --name {self.name}")
         if self.args:
-            cmd.extend([" ".join(self.args)])
+            cmd.extend(self.args)
         if self.envs:
-            cmd.extend([f"-e {env}" for env in self.envs])
+            cmd.extend(f"-e {env}" for env in self.envs)
         if self.ports:
-            cmd.extend([f"-p {port}" for port in self.ports])
+            cmd.extend(f"-p {port}" for port in self.ports)
         if self.vols:
-            cmd.extend([f"-v {vol}" for vol in self.vols])
+            cmd.extend(f"-v {vol}" for vol in self.vols)
         if self.image:
-            cmd.extend([f" {self.image}"])
+            cmd.append(f" {self.image}")
         return " ".join(cmd)
-
-    def __repr__(self) -> str:
-        """Return the string representation of the service instance."""
-        attrs = []
-        for field in self.model_fields:
-            value = getattr(self, field)
-            if value is not None:
-                attrs.append(f"{field}={value!r}")
-        return f"DslService({', '.join(attrs)})"
@@ -2,14 +2,15 @@
 Test configuration models.
 """
 
-import copy
 from typing import Any
 
-from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator
 
 from octopus.dsl.checker import Expect
-from octopus.dsl.constants import TestMode
+from octopus.dsl.constants import STRICT_MODE, TestMode
+from octopus.dsl.interface import FieldReprMixin
 from octopus.dsl.runner import (
+    RUNNER_TYPES,
     BaseRunner,
     DockerRunner,
     GrpcRunner,
@@ -21,13 +22,13 @@ from octopus.dsl.runner import (
 from octopus.dsl.variable import VariableEvaluator
 
 
-class DslTest(BaseModel):
+class DslTest(FieldReprMixin, BaseModel):
     """Test configuration.
 
     This model represents the configuration of a test.
     """
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", validate_assignment=STRICT_MODE)
 
     name: str = Field(description="Test name")
     desc: str = Field(description="Test description")
@@ -38,7 +39,10 @@ class DslTest(BaseModel):
     )
     expect: Expect = Field(description="Test expectations")
 
-    __origin_data: dict[str, Any] = PrivateAttr(default_factory=dict)
+    # original data of the fields that contain variable references
+    __templates: dict[str, Any] = PrivateAttr(default_factory=dict)
+    # (variables key, evaluated data of templated fields) of the last evaluation
+    __evaluated_cache: tuple[Any, dict[str, Any]] | None = PrivateAttr(default=None)
 
     def __init__(self, **data: Any):
         """Initialize the test configuration.
@@ -49,15 +53,14 @@ class DslTest(BaseModel):
         # initialize other fields first
         super().__init__(**data)
 
-        # manually create expect instance, pass in mode
-        if "expect" in data and isinstance(data["expect"], dict) and not isinstance(data["expect"], Expect):
-            self.expect = Expect(**data["expect"])
+        # expect is validated once as a field, only its mode follows the test
+        self._sync_expect_mode()
 
         if "runner" in data and isinstance(data["runner"], dict):
             self.runner = create_runner(self.mode, data["runner"])
 
-        # Store original data for evaluate
-        self.__origin_data = copy.deepcopy(data)
+        # Store templated fields for evaluate
+        self.__templates = VariableEvaluator.extract_templates(data)
 
     @field_validator("mode")
     @classmethod
@@ -75,50 +78,6 @@ class DslTest(BaseModel):
             raise ValueError(f"Invalid test mode: {v}")
         return v
 
-    @field_validator("expect")
-    @classmethod
-    def validate_expect(cls, v: Expect, info: ValidationInfo) -> Expect:
-        """Validate and initialize expect with test mode.
-
-        Args:
-            v: The expect instance
-            info: Validation info containing other field values
-
-        Returns:
-            Expect: The validated expect instance
-        """
-        # Get current field name
-        # field_name = info.field_name  # Should be "expect"
-        # logger.debug(f"field_name: {field_name}")
-
-        # Get all fields in context
-        all_data = info.data  # Dictionary containing all fields
-
-        # Get specific field value
-        mode = all_data.get("mode")
-        if mode is None:
-            return v
-
-        # if expect is a dictionary, create a new Expect instance
-        if isinstance(v, dict):
-            return Expect(mode=mode, **v)
-
-        # if expect is already an Expect instance, update its mode
-        v.mode = mode
-        return v
-
-    @model_validator(mode="after")
-    def update_expect_mode(self) -> "DslTest":
-        """Update co-related attributes after reassignment
-        e.g. update test.expect.mode when test.mode changes.
-
-        Returns:
-            DslTest: The updated test instance
-        """
-        if self.expect:
-            self.expect.mode = self.mode
-        return self
-
     @classmethod
     def from_dict(cls, body: dict[str, Any]) -> "DslTest":
         """Create a Test instance from a dictionary.
@@ -197,45 +156,73 @@ class DslTest(BaseModel):
         if mode is None:
             return v
 
-        runner_types = {
-            TestMode.SHELL: ShellRunner,
-            TestMode.HTTP: HttpRunner,
-            TestMode.GRPC: GrpcRunner,
-            TestMode.PYTEST: PytestRunner,
-            TestMode.DOCKER: DockerRunner,
-        }
-
-        expected_type = runner_types[mode]
-        if not isinstance(v, expected_type):
+        # runners are leaf classes, an exact type check is enough
+        expected_type = RUNNER_TYPES[mode]
+        if type(v) is not expected_type:
             raise ValueError(
                 f"Invalid runner type for mode {mode}. " f"Expected {expected_type.__name__}, got {type(v).__name__}"
             )
 
         return v
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Set an attribute, keeping expect.mode in sync with the test mode.
+
+        Args:
+            name: Attribute name
+            value: Attribute value
+        """
+        super().__setattr__(name, value)
+        if name in ("mode", "expect"):
+            self._sync_expect_mode()
+
+    def _sync_expect_mode(self) -> None:
+        """Update expect.mode when the test mode or expect changes."""
+        if self.expect.mode != self.mode:
+            # mode is already validated, no need to revalidate the expect
+            object.__setattr__(self.expect, "mode", self.mode)
+
     def evaluate(self, variables: dict[str, Any]) -> None:
         """Evaluate the test with given variables.
 
         This method is idempotent, multiple evaluations produce the same result.
-        1. Restoring the original data from __origin_data
+        1. Restoring the original data of templated fields from __templates
         2. Evaluating variables in the restored data
-        3. Updating the model with evaluated values
+        3. Updating the templated fields with evaluated values
+
+        Nothing is done when no field contains variable references. The values
+        of the last evaluation are cached and restored from a copy when called
+        again with the same variables.
 
         Args:
             variables: A dictionary of variables to evaluate the test with
         """
-        # Restore original data
-        data = copy.deepcopy(self.__origin_data)
-
-        # Evaluate variables in the data
-        VariableEvaluator.evaluate_dict(data, variables)
-
-        # Update model with evaluated values
-        updated_data = self.model_validate(data)
-        for k, v in updated_data.__dict__.items():
-            if k.startswith("_") or k in ["model_config", "model_fields"]:
-                continue
-            setattr(self, k, v)
+        if not self.__templates:
+            return
+
+        key = VariableEvaluator.cache_key(variables)
+        if self.__evaluated_cache is not None and self.__evaluated_cache[0] == key:
+            # Copy the cached data, fields may have been changed in place since
+            data = VariableEvaluator.snapshot(self.__evaluated_cache[1])
+        else:
+            # Restore original data of templated fields
+            data = VariableEvaluator.snapshot(self.__templates)
+
+            # Evaluate variables in the data
+            VariableEvaluator.evaluate_dict(data, variables)
+            self.__evaluated_cache = (key, VariableEvaluator.snapshot(data))
+
+        # Rebuild nested models from their evaluated configuration
+        if isinstance(data.get("runner"), dict):
+            data["runner"] = create_runner(self.mode, data["runner"])
+        if isinstance(data.get("expect"), dict):
+            data["expect"] = Expect(**{**data["expect"], "mode": self.mode})
+
+        # Update model with evaluated values. The original data was validated on
+        # construction and evaluation only substitutes string leaves, so it is
+        # trusted: write the fields in place without validation.
+        self.__dict__.update(data)
+        self._sync_expect_mode()
 
     def model_dump(self, **kwargs) -> dict[str, Any]:
         """Convert the model to a dictionary.
@@ -266,12 +253,3 @@ class DslTest(BaseModel):
     def get_command(self) -> str:
         """Get the command of the test."""
         return self.runner.get_command()
-
-    def __repr__(self) -> str:
-        """Return the string representation of the test instance."""
-        attrs = []
-        for field in self.model_fields:
-            value = getattr(self, field)
-            if value is not None:
-                attrs.append(f"{field}={value!r}")
-        return f"DslTest({', '.join(attrs)})"
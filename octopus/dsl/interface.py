@@ -3,7 +3,7 @@ Interface definitions for test runners.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, ClassVar
 
 
 class RunnerInterface(ABC):
@@ -45,3 +45,24 @@ class Evaluable(ABC):
             variables: A dictionary of variables to evaluate the object with
         """
         pass
+
+
+class FieldReprMixin:
+    """Mixin for pydantic models to represent set fields as `Name(field=value, ...)`.
+
+    Must come before BaseModel in the bases so the subclass hook is called.
+    """
+
+    __repr_fields__: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the field names once the model class is complete."""
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__repr_fields__ = tuple(cls.model_fields)
+
+    def __repr__(self) -> str:
+        """Return the string representation of the model instance."""
+        values = self.__dict__
+        attrs = [f"{field}={values[field]!r}" for field in self.__repr_fields__ if values.get(field) is not None]
+        return f"{type(self).__name__}({', '.join(attrs)})"
@@ -2,25 +2,22 @@
 Test runner implementations.
 """
 
-import copy
-import sys
 from typing import Any
 
-from loguru import logger
 from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
-from octopus.dsl.constants import TEST_RUNNER_FIELDS, HttpMethod, TestMode
-from octopus.dsl.interface import RunnerInterface
+from octopus.dsl.constants import STRICT_MODE, TEST_RUNNER_FIELDS, HttpMethod, TestMode
+from octopus.dsl.interface import FieldReprMixin, RunnerInterface
 from octopus.dsl.variable import VariableEvaluator
 
-logger.remove()
-logger.add(sys.stdout, level="DEBUG")
 
-
-class BaseRunner(BaseModel, RunnerInterface):
+class BaseRunner(FieldReprMixin, BaseModel, RunnerInterface):
     """Base class for all test runners."""
 
-    __origin_data: dict[str, Any] = PrivateAttr(default_factory=dict)
+    # original data of the fields that contain variable references
+    __templates: dict[str, Any] = PrivateAttr(default_factory=dict)
+    # (variables key, evaluated data of templated fields) of the last evaluation
+    __evaluated_cache: tuple[Any, dict[str, Any]] | None = PrivateAttr(default=None)
 
     def __init__(self, **data: Any):
         """Initialize the runner with configuration.
@@ -29,8 +26,8 @@ class BaseRunner(BaseModel, RunnerInterface):
             **data: Runner configuration data
         """
         super().__init__(**data)
-        # Store original data for evaluate
-        self.__origin_data = copy.deepcopy(data)
+        # Store templated fields for evaluate
+        self.__templates = VariableEvaluator.extract_templates(data)
 
     def get_config(self) -> dict[str, Any]:
         """Get the runner's configuration.
@@ -52,40 +49,42 @@ class BaseRunner(BaseModel, RunnerInterface):
         """Evaluate the runner with given variables.
 
         This method is idempotent, multiple evaluations produce the same result.
-        1. Restoring the original data from __origin_data
+        1. Restoring the original data of templated fields from __templates
         2. Evaluating variables in the restored data
-        3. Updating the model with evaluated values
+        3. Updating the templated fields with evaluated values
+
+        Nothing is done when no field contains variable references. The values
+        of the last evaluation are cached and restored from a copy when called
+        again with the same variables.
 
         Args:
             variables: A dictionary of variables to evaluate the runner with
         """
-        # Restore original data
-        data = copy.deepcopy(self.__origin_data)
+        if not self.__templates:
+            return
 
-        # Evaluate variables in the data
-        VariableEvaluator.evaluate_dict(data, variables)
+        key = VariableEvaluator.cache_key(variables)
+        if self.__evaluated_cache is not None and self.__evaluated_cache[0] == key:
+            # Copy the cached data, fields may have been changed in place since
+            data = VariableEvaluator.snapshot(self.__evaluated_cache[1])
+        else:
+            # Restore original data of templated fields
+            data = VariableEvaluator.snapshot(self.__templates)
 
-        # Update model with evaluated values
-        updated_data = self.model_validate(data)
-        for k, v in updated_data.__dict__.items():
-            if k.startswith("_") or k in ["model_config", "model_fields"]:
-                continue
-            setattr(self, k, v)
+            # Evaluate variables in the data
+            VariableEvaluator.evaluate_dict(data, variables)
+            self.__evaluated_cache = (key, VariableEvaluator.snapshot(data))
 
-    def __repr__(self) -> str:
-        """Return the string representation of the runner instance."""
-        attrs = []
-        for field in self.model_fields:
-            value = getattr(self, field)
-            if value is not None:
-                attrs.append(f"{field}={value!r}")
-        return f"{self.__class__.__name__}({', '.join(attrs)})"
+        # Update model with evaluated values. The original data was validated on
+        # construction and evaluation only substitutes string leaves, so it is
+        # trusted: write the fields in place without validation.
+        self.__dict__.update(data)
 
 
 class ShellRunner(BaseRunner):
     """Shell command test runner."""
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", validate_assignment=STRICT_MODE)
 
     cmd: list[str] = Field(description="Shell command")
 
@@ -101,7 +100,7 @@ class ShellRunner(BaseRunner):
 class HttpRunner(BaseRunner):
     """HTTP request test runner."""
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", validate_assignment=STRICT_MODE)
 
     header: str = Field(description="HTTP header")
     method: HttpMethod = Field(default=HttpMethod.GET, description="HTTP method")
@@ -115,15 +114,16 @@ class HttpRunner(BaseRunner):
             str: The curl command string
         """
         required = TEST_RUNNER_FIELDS[TestMode.HTTP]
-        if not all(field in self.get_config() for field in required):
+        if not all(field in self.__dict__ for field in required):
             raise ValueError(f"HTTP runner requires fields: {required}")
 
         cmd = ["curl"]
         if self.header:
-            cmd.extend(["-H", f"""'{self.header}'"""])
-        cmd.extend(["-X", self.method])
-        if self.payload and self.method not in [HttpMethod.GET, HttpMethod.DELETE]:
-            cmd.extend(["-d", f"'{self.payload}'"])
+            cmd.append(f"-H '{self.header}'")
+        cmd.append("-X")
+        cmd.append(self.method)
+        if self.payload and self.method not in (HttpMethod.GET, HttpMethod.DELETE):
+            cmd.append(f"-d '{self.payload}'")
         cmd.append(f"'{self.endpoint}'")
         return " ".join(cmd)
 
@@ -131,7 +131,7 @@ class HttpRunner(BaseRunner):
 class GrpcRunner(BaseRunner):
     """gRPC request test runner."""
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", validate_assignment=STRICT_MODE)
 
     proto: str | None = Field(default=None, description="gRPC proto file")
     function: str = Field(description="gRPC function")
@@ -145,13 +145,14 @@ class GrpcRunner(BaseRunner):
             str: The grpcurl command string
         """
         required = TEST_RUNNER_FIELDS[TestMode.GRPC]
-        if not all(field in self.get_config() for field in required):
+        if not all(field in self.__dict__ for field in required):
             raise ValueError(f"gRPC runner requires fields: {required}")
 
         cmd = ["grpcurl"]
-        cmd.extend(["-proto", self.proto]) if self.proto else None
-        cmd.extend(["-d", f"'{self.payload}'"])
-        cmd.extend(["-plaintext", self.endpoint])
+        if self.proto:
+            cmd.append(f"-proto {self.proto}")
+        cmd.append(f"-d '{self.payload}'")
+        cmd.append(f"-plaintext {self.endpoint}")
         cmd.append(self.function)
         return " ".join(cmd)
 
@@ -159,7 +160,7 @@ class GrpcRunner(BaseRunner):
 class PytestRunner(BaseRunner):
     """Pytest test runner."""
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", validate_assignment=STRICT_MODE)
 
     root_dir: str | None = Field(default=None, description="Pytest root directory")
     test_args: list[str] = Field(description="Pytest test arguments")
@@ -171,12 +172,12 @@ class PytestRunner(BaseRunner):
             str: The pytest command string
         """
         required = TEST_RUNNER_FIELDS[TestMode.PYTEST]
-        if not all(field in self.get_config() for field in required):
+        if not all(field in self.__dict__ for field in required):
             raise ValueError(f"Pytest runner requires fields: {required}")
 
         cmd = ["pytest"]
         if self.root_dir:
-            cmd.extend(["--rootdir", self.root_dir])
+            cmd.append(f"--rootdir {self.root_dir}")
         if self.test_args:
             cmd.extend(self.test_args)
         return " ".join(cmd)
@@ -185,7 +186,7 @@ class PytestRunner(BaseRunner):
 class DockerRunner(BaseRunner):
     """Docker command test runner."""
 
-    model_config = ConfigDict(extra="forbid", validate_assignment=True)
+    model_config = ConfigDict(extra="forbid", validate_assignment=STRICT_MODE)
 
     cntr_name: str = Field(description="Docker container name to run command")
     cmd: list[str] = Field(description="Execute command in docker container")
@@ -196,11 +197,21 @@ class DockerRunner(BaseRunner):
         Returns:
             str: The docker command string
         """
-        if "cntr_name" not in self.get_config():
+        if "cntr_name" not in self.__dict__:
             raise ValueError("Docker runner requires 'cntr_name' in config")
-        if "cmd" not in self.get_config():
+        if "cmd" not in self.__dict__:
             raise ValueError("Docker runner requires 'cmd' in config")
-        return "docker exec " + self.cntr_name + " " + " ".join(self.cmd)
+        return f"docker exec {self.cntr_name} {' '.join(self.cmd)}"
+
+
+# Runner class for each test mode
+RUNNER_TYPES: dict[TestMode, type[BaseRunner]] = {
+    TestMode.SHELL: ShellRunner,
+    TestMode.HTTP: HttpRunner,
+    TestMode.GRPC: GrpcRunner,
+    TestMode.PYTEST: PytestRunner,
+    TestMode.DOCKER: DockerRunner,
+}
 
 
 def create_runner(mode: TestMode, config: dict[str, Any]) -> RunnerInterface:
@@ -216,15 +227,7 @@ def create_runner(mode: TestMode, config: dict[str, Any]) -> RunnerInterface:
     Raises:
         ValueError: If mode is not supported
     """
-    runners: dict[TestMode, type[RunnerInterface]] = {
-        TestMode.SHELL: ShellRunner,
-        TestMode.HTTP: HttpRunner,
-        TestMode.GRPC: GrpcRunner,
-        TestMode.PYTEST: PytestRunner,
-        TestMode.DOCKER: DockerRunner,
-    }
-
-    if mode not in runners:
+    if mode not in RUNNER_TYPES:
         raise ValueError(f"Unsupported test mode: {mode}")
 
-    return runners[mode](**config)
+    return RUNNER_TYPES[mode](**config)
@@ -306,6 +306,50 @@ def test_dsl_service_idempotent_evaluation(sample_service_data):
     assert first_result == third_result
 
 
+def test_dsl_service_repeated_evaluation(sample_service_data):
+    """Test evaluating again with the same variables restores the evaluated values."""
+    sample_service_data["name"] = "${service_name}"
+    service = DslService.from_dict(sample_service_data)
+
+    variables = {"service_name": "service1"}
+    service.evaluate(variables)
+    assert service.name == "service1"
+
+    service.name = "renamed"
+    service.evaluate(dict(variables))
+    assert service.name == "service1"
+
+    service.evaluate({"service_name": "service2"})
+    assert service.name == "service2"
+
+
+def test_dsl_service_repeated_evaluation_after_in_place_change(sample_service_data):
+    """Test in-place changes don't leak into a re-evaluation with the same variables."""
+    sample_service_data["envs"] = ["HOST=${host}"]
+    service = DslService.from_dict(sample_service_data)
+
+    variables = {"host": "localhost"}
+    service.evaluate(variables)
+    service.envs.append("LEAK=1")
+    service.evaluate(variables)
+    assert service.envs == ["HOST=localhost"]
+
+    # Values are keyed by their substituted string
+    service.evaluate({"host": 1})
+    assert service.envs == ["HOST=1"]
+    service.evaluate({"host": True})
+    assert service.envs == ["HOST=True"]
+
+
+def test_dsl_service_evaluation_without_variables(sample_service_data):
+    """Test evaluating a service without variable references leaves it untouched."""
+    service = DslService.from_dict(sample_service_data)
+    service.image = "nginx:stable"
+    service.evaluate({"service_name": "service2"})
+    assert service.name == "service1"
+    assert service.image == "nginx:stable"
+
+
 def test_dsl_service_get_command(sample_service_data):
     """Test getting service command."""
     service = DslService.from_dict(sample_service_data)
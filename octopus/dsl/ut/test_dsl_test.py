@@ -337,6 +337,18 @@ def test_dsl_test_runner_type_validation():
         logger.debug(f"Runner type validation passed for mode {mode}")
 
 
+def test_dsl_test_runner_type_mismatch():
+    """Test runner instance must match the test mode."""
+    with pytest.raises(ValidationError, match="Invalid runner type for mode shell"):
+        DslTest(
+            name="test",
+            desc="test",
+            mode=TestMode.SHELL,
+            runner=DockerRunner(cntr_name="test_container", cmd=["echo", "test"]),
+            expect={"mode": TestMode.SHELL, "exit_code": 0, "stdout": "test", "stderr": ""},
+        )
+
+
 def test_dsl_test_expect_http_validation():
     """Test expect validation and initialization."""
     # Test expect initialization with mode
@@ -358,6 +370,22 @@ def test_dsl_test_expect_http_validation():
     assert test.expect.mode == TestMode.GRPC
 
 
+def test_dsl_test_expect_mode_sync():
+    """Test expect mode follows the test mode on init and on reassignment."""
+    test = DslTest(
+        name="test",
+        desc="test",
+        mode=TestMode.SHELL,
+        runner={"cmd": ["echo", "test"]},
+        expect=Expect(mode=TestMode.DOCKER, exit_code=0, stdout="test", stderr=""),
+    )
+    assert test.expect.mode == TestMode.SHELL
+
+    test.expect = Expect(mode=TestMode.DOCKER, exit_code=1, stdout="", stderr="error")
+    assert test.expect.mode == TestMode.SHELL
+    assert test.expect.exit_code == 1
+
+
 def test_dsl_test_extra_fields():
     """Test DslTest extra fields validation."""
     # Test with extra fields
@@ -613,6 +641,20 @@ def test_dsl_test_idempotent_evaluation(sample_test_data):
     assert first_result == third_result
 
 
+def test_dsl_test_repeated_evaluation_after_in_place_change(sample_test_data):
+    """Test in-place changes of nested models don't leak into a re-evaluation."""
+    sample_test_data["runner"]["cmd"] = ["echo", "${service_name}"]
+    test = DslTest.from_dict(sample_test_data)
+
+    variables = {"service_name": "service1"}
+    test.evaluate(variables)
+    runner = test.runner
+    test.runner.cmd = ["rm", "-rf"]
+    test.evaluate(variables)
+    assert test.runner.cmd == ["echo", "service1"]
+    assert test.runner is not runner
+
+
 def test_dsl_test_get_command(sample_test_data):
     """Test getting test command."""
     test = DslTest.from_dict(sample_test_data)
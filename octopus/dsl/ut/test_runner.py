@@ -1,6 +1,7 @@
 """Unit tests for runner module."""
 
 import sys
+import weakref
 
 import pydantic_core
 import pytest
@@ -327,3 +328,45 @@ def test_runner_validation():
         DockerRunner()
     with pytest.raises(pydantic_core._pydantic_core.ValidationError, match="validation error for DockerRunner"):
         DockerRunner(cntr_name="test_container")
+
+
+def test_http_runner_evaluate():
+    """Test HTTP runner variable evaluation."""
+    runner = HttpRunner(
+        header="",
+        method="POST",
+        payload='{"name": "${user}"}',
+        endpoint="http://${host}:8080",
+    )
+    runner.evaluate({"user": "Jack", "host": "localhost"})
+    assert runner.method is HttpMethod.POST
+    assert runner.endpoint == "http://localhost:8080"
+    assert runner.get_command() == """curl -X POST -d '{"name": "Jack"}' 'http://localhost:8080'"""
+
+    # Evaluation always starts over from the original data
+    runner.evaluate({"user": "Rose", "host": "127.0.0.1"})
+    assert runner.payload == '{"name": "Rose"}'
+    assert runner.endpoint == "http://127.0.0.1:8080"
+
+
+def test_runner_repr():
+    """Test runner representation skips unset fields."""
+    runner = GrpcRunner(function="hello.Greeter/SayHello", endpoint="localhost:50051", payload="{}")
+    assert repr(runner) == "GrpcRunner(function='hello.Greeter/SayHello', endpoint='localhost:50051', payload='{}')"
+
+
+def test_runner_get_command_missing_fields():
+    """Test get_command rejects runners built without required fields."""
+    with pytest.raises(ValueError, match="gRPC runner requires fields"):
+        GrpcRunner.model_construct(function="hello.Greeter/SayHello", endpoint="localhost:50051").get_command()
+    with pytest.raises(ValueError, match="Docker runner requires 'cntr_name'"):
+        DockerRunner.model_construct(cmd=["echo", "test"]).get_command()
+
+    # Optional fields left unset still count as present
+    runner = HttpRunner(header="", endpoint="http://localhost:8080")
+    assert runner.get_command() == "curl -X GET 'http://localhost:8080'"
+
+
+def test_runner_weakref(shell_runner: ShellRunner):
+    """Test runners can be weakly referenced."""
+    assert weakref.ref(shell_runner)() is shell_runner
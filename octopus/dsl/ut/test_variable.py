@@ -2,7 +2,7 @@
 
 import pytest
 
-from octopus.dsl.variable import Variable
+from octopus.dsl.variable import Variable, VariableEvaluator
 
 
 @pytest.fixture
@@ -99,3 +99,58 @@ def test_variable_str_representation(normal_variable, lazy_variable):
     # Test lazy variable string representation
     assert str(lazy_variable) == "$cntr_name: service_container"
     assert repr(lazy_variable) == "Variable(key='$cntr_name', value='service_container')"
+
+
+def test_variable_evaluator_snapshot():
+    """Test snapshot copies containers and shares immutable leaves."""
+    data = {"name": "${service_name}", "args": ["--port", 8080], "runner": {"cmd": ["echo", None]}}
+    snapshot = VariableEvaluator.snapshot(data)
+    assert snapshot == data
+    assert snapshot is not data
+    assert snapshot["args"] is not data["args"]
+    assert snapshot["runner"]["cmd"] is not data["runner"]["cmd"]
+    assert snapshot["name"] is data["name"]
+
+    # Evaluating the snapshot leaves the original data untouched
+    VariableEvaluator.evaluate_dict(snapshot, {"service_name": "service1"})
+    assert snapshot["name"] == "service1"
+    assert data["name"] == "${service_name}"
+
+
+def test_variable_evaluator_evaluate_value():
+    """Test variable references are substituted in a value."""
+    variables = {"host": "localhost", "port": 8080}
+    assert VariableEvaluator.evaluate_value("http://${host}:${port}/${host}", variables) == (
+        "http://localhost:8080/localhost"
+    )
+    # Unknown references are left untouched
+    assert VariableEvaluator.evaluate_value("${host}:${unknown}", variables) == "localhost:${unknown}"
+    assert VariableEvaluator.evaluate_value("no variables", variables) == "no variables"
+    assert VariableEvaluator.evaluate_value(42, variables) == 42
+
+
+def test_variable_evaluator_extract_templates():
+    """Test only fields with variable references are extracted."""
+    data = {
+        "name": "${service_name}",
+        "image": "nginx:latest",
+        "envs": ["ENV=prod", "HOST=${host}"],
+        "runner": {"cmd": ["echo", "test"]},
+        "ports": [],
+    }
+    templates = VariableEvaluator.extract_templates(data)
+    assert templates == {"name": "${service_name}", "envs": ["ENV=prod", "HOST=${host}"]}
+    assert templates["envs"] is not data["envs"]
+    assert VariableEvaluator.extract_templates({"image": "nginx:latest"}) == {}
+    # An unterminated reference is not a variable
+    assert VariableEvaluator.extract_templates({"cmd": ["echo", "${not_a_var"]}) == {}
+
+
+def test_variable_evaluator_cache_key():
+    """Test cache keys follow the substituted string of each value."""
+    assert VariableEvaluator.cache_key({"a": "x", "b": 1}) == VariableEvaluator.cache_key({"b": 1, "a": "x"})
+    assert VariableEvaluator.cache_key({"a": 1}) != VariableEvaluator.cache_key({"a": True})
+    assert VariableEvaluator.cache_key({"a": 1}) != VariableEvaluator.cache_key({"a": 1.0})
+    assert VariableEvaluator.cache_key({"a": 1}) == VariableEvaluator.cache_key({"a": "1"})
+    # Unhashable values are keyed too
+    assert VariableEvaluator.cache_key({"a": [1]}) == VariableEvaluator.cache_key({"a": [1]})
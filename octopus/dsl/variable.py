@@ -1,3 +1,4 @@
+import copy
 import re
 from typing import Any
 
@@ -75,20 +76,74 @@ class Variable(BaseModel):
         return self.model_dump()
 
 
+# Leaf types that are immutable and safe to share between snapshots
+_ATOMIC_TYPES = (str, int, float, bool, type(None))
+
+# Variable reference in a value, e.g. ${service_name}
+_VAR_PATTERN = re.compile(r"\${([^}]+)}")
+
+
 class VariableEvaluator:
     """Variable evaluator"""
 
+    @staticmethod
+    def snapshot(data: Any) -> Any:
+        """Snapshot JSON-shaped data for later evaluation.
+
+        Only dict and list containers are copied, immutable leaves are shared
+        by reference. Any other leaf falls back to copy.deepcopy.
+        """
+        t = type(data)
+        if t is dict:
+            return {k: VariableEvaluator.snapshot(v) for k, v in data.items()}
+        if t is list:
+            return [VariableEvaluator.snapshot(v) for v in data]
+        if isinstance(data, _ATOMIC_TYPES):
+            return data
+        return copy.deepcopy(data)
+
+    @staticmethod
+    def has_variables(data: Any) -> bool:
+        """Check whether data contains any variable reference."""
+        t = type(data)
+        if t is dict:
+            return any(VariableEvaluator.has_variables(v) for v in data.values())
+        if t is list:
+            return any(VariableEvaluator.has_variables(v) for v in data)
+        return isinstance(data, str) and _VAR_PATTERN.search(data) is not None
+
+    @staticmethod
+    def extract_templates(data: dict[str, Any]) -> dict[str, Any]:
+        """Snapshot the fields of data that contain variable references.
+
+        Returns:
+            dict[str, Any]: The templated fields, to be evaluated later
+        """
+        return {k: VariableEvaluator.snapshot(v) for k, v in data.items() if VariableEvaluator.has_variables(v)}
+
+    @staticmethod
+    def cache_key(variables: dict[str, Any]) -> Any:
+        """Build a hashable key identifying a set of variables.
+
+        Values are keyed by their string form, which is what gets substituted,
+        so e.g. 1 and True give different keys.
+
+        Returns:
+            Any: frozenset of the variable names and substituted values
+        """
+        return frozenset((k, str(v)) for k, v in variables.items())
+
     @staticmethod
     def evaluate_value(value: Any, variables: dict[str, Any]) -> Any:
         """evaluate value with given variables"""
-        if isinstance(value, str):
-            pattern = r"\${([^}]+)}"
-            matches = re.finditer(pattern, value)
-            for match in matches:
-                var_key = match.group(1)
-                if var_key in variables:
-                    value = value.replace(match.group(0), str(variables[var_key]))
-        return value
+        if not isinstance(value, str) or "${" not in value:
+            return value
+
+        def _replace(match: re.Match) -> str:
+            var_key = match.group(1)
+            return str(variables[var_key]) if var_key in variables else match.group(0)
+
+        return _VAR_PATTERN.sub(_replace, value)
 
     @staticmethod
     def evaluate_dict(data: dict[str, Any], variables: dict[str, Any]) -> None: